@@ -39,18 +39,19 @@ class LTM:
         sum_execute_cost = random.random() - 3
         survival_rate = -(random.random() * 0.1)
 
-        # Calculate all shortest paths
+        # Calculate all shortest paths, flattened once to (from, to) keys for reuse
         self.shortest_path_dict = dict(nx.all_pairs_dijkstra_path_length(self.arc_graph, weight='weight'))
+        shortest_path_dict = self._convert_shortest_path_dict()
 
         # Execute task migration
         ltm_migration = LTMTasksMigration(
             self.id_to_groups, self.id_to_robots,
-            self._convert_shortest_path_dict(), self.arc_graph
+            shortest_path_dict, self.arc_graph
         )
         migration_records = ltm_migration.task_migration()
 
         sum_migration_cost += evalution.calculate_migration_cost(
-            self._convert_shortest_path_dict(), migration_records
+            shortest_path_dict, migration_records
         )
         sum_execute_cost += evalution.calculate_execute_tasks_cost(self.robots)
         survival_rate += evalution.calculate_mean_survival_rate(self.robots)
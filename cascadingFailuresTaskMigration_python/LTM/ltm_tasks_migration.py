@@ -17,8 +17,7 @@ class LTMTasksMigration:
 
     def task_migration(self) -> List[MigrationRecord]:
         """Execute task migration for LTM algorithm."""
-        for robot_id in self.id_to_robots.keys():
-            robot = self.id_to_robots[robot_id]
+        for robot in self.id_to_robots.values():
             if robot.fault_a == 1:
                 tfs = list(robot.tasks_list)
                 for task in tfs:
@@ -29,10 +28,9 @@ class LTMTasksMigration:
     def _greedy_find_migrated_robot(self, f_robot: Robot) -> Robot:
         """Greedily find robot to migrate tasks to based on capacity/load ratio."""
         migrated_robot = Robot()
-        neighbors = list(self.arc_graph.neighbors(f_robot.robot_id))
         max_cratio = float('-inf')
 
-        for neighbor_id in neighbors:
+        for neighbor_id in self.arc_graph.neighbors(f_robot.robot_id):
             target_robot = self.id_to_robots[neighbor_id]
 
             if target_robot.group_id != f_robot.group_id:
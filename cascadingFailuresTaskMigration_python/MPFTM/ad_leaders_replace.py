@@ -1,20 +1,23 @@
 import networkx as nx
-from typing import Dict, List
+from typing import Dict, List, Optional
 from input.group import Group
 from input.robot import Robot
+from .group_betweenness import GroupBetweenness
 
 
 class AdLeadersReplace:
     def __init__(self, id_to_groups: Dict[int, Group], id_to_robots: Dict[int, Robot],
-                 arc_graph: nx.Graph):
+                 arc_graph: nx.Graph, group_betweenness: Optional[GroupBetweenness] = None):
         self.id_to_groups = id_to_groups
         self.id_to_robots = id_to_robots
         self.arc_graph = arc_graph
+        if group_betweenness is None:
+            group_betweenness = GroupBetweenness(arc_graph)
+        self.group_betweenness = group_betweenness
 
     def run(self):
         """Replace failed leaders with backup leaders."""
-        for group_id in self.id_to_groups.keys():
-            group = self.id_to_groups[group_id]
+        for group in self.id_to_groups.values():
             if group.leader.fault_a == 1:
                 self._replace(group)
 
@@ -22,28 +25,8 @@ class AdLeadersReplace:
         """Replace leader with best backup leader."""
         ad_leaders = group.ad_leaders
 
-        # Create subgraph
-        sub_graph = nx.Graph()
-        robot_id_set = group.robot_id_in_group
-
-        for robot_id in robot_id_set:
-            sub_graph.add_node(robot_id)
-            neighbors = list(self.arc_graph.neighbors(robot_id))
-
-            for neighbor_id in neighbors:
-                if neighbor_id == robot_id:
-                    continue
-
-                if self.id_to_robots[neighbor_id].group_id != group.group_id:
-                    continue
-
-                sub_graph.add_node(neighbor_id)
-                if not sub_graph.has_edge(robot_id, neighbor_id):
-                    weight = self.arc_graph[robot_id][neighbor_id]['weight']
-                    sub_graph.add_edge(robot_id, neighbor_id, weight=weight)
-
-        # Calculate betweenness centrality
-        betweenness_centrality = nx.betweenness_centrality(sub_graph, weight='weight')
+        # Betweenness centrality of the group's subgraph
+        betweenness_centrality = self.group_betweenness.calculate(group)
 
         # This I measures betweenness centrality
         replace_leader = ad_leaders[0]
@@ -1,3 +1,4 @@
+from collections import Counter
 import networkx as nx
 from typing import Dict
 from input.group import Group
@@ -30,8 +31,9 @@ class CalculatePonField:
         i_sum = sum(self.id_to_i.values())
         i_mean = i_sum / len(self.id_to_robots)
 
-        for robot_id in self.id_to_robots.keys():
-            robot = self.id_to_robots[robot_id]
+        function = Function(self.id_to_robots, self.id_to_groups)
+
+        for robot_id, robot in self.id_to_robots.items():
             p = PotentialField()
 
             # Set attractive potential field
@@ -40,9 +42,7 @@ class CalculatePonField:
 
             # Set repulsive potential field
             ro = 0.0
-            neighbors = list(self.arc_graph.neighbors(robot_id))
-
-            for neighbor_id in neighbors:
+            for neighbor_id, edge in self.arc_graph[robot_id].items():
                 target_robot = self.id_to_robots[neighbor_id]
 
                 if target_robot.robot_id == robot_id:
@@ -53,20 +53,20 @@ class CalculatePonField:
 
                 if target_robot.fault_a == 1:
                     # Inversely proportional to distance to faulty node
-                    weight = self.arc_graph[robot_id][neighbor_id]['weight']
-                    ro += 1 / weight
+                    ro += 1 / edge['weight']
 
             if robot.fault_a == 1:
                 p.perep = float('inf') / 2
             elif ro != 0:
-                p.perep = self.b * (self.y * 1 / ro) * (1 / ro)
+                # Divide once and reuse the reciprocal for the squared term
+                inv_ro = 1 / ro
+                p.perep = self.b * (self.y * inv_ro) * inv_ro
             else:
                 p.perep = 0.0
 
             intra_potential[robot_id] = p
 
             # Update overload fault condition
-            function = Function(self.id_to_robots, self.id_to_groups)
             fault_o = 1 - function.calculate_over_load_is(self.id_to_robots[robot_id])
             robot.fault_o = fault_o
 
@@ -76,22 +76,19 @@ class CalculatePonField:
         """Calculate potential field for network layer (inter-group)."""
         inter_potential = {}
 
-        for group_id in self.id_to_groups.keys():
-            group = self.id_to_groups[group_id]
+        # Number of robots with functional faults in each group, tallied in one pass
+        fault_counts = Counter(robot.group_id for robot in self.id_to_robots.values()
+                               if robot.fault_a == 1)
+
+        for group_id, group in self.id_to_groups.items():
             p = PotentialField()
 
             # Calculate attractive potential field for network layer
             p.pegra = self.a * self.xn * group.group_load
 
             # Calculate repulsive field for network layer
-            fk = 0
-            robot_id_in_group = group.robot_id_in_group
-            for robot_id in robot_id_in_group:
-                robot = self.id_to_robots[robot_id]
-                if robot.fault_a == 1:
-                    fk += 1
-
-            nk = len(robot_id_in_group)
+            fk = fault_counts[group_id]
+            nk = len(group.robot_id_in_group)
             if fk == nk:
                 p.perep = float('inf') / 2
             else:
@@ -1,37 +1,23 @@
 import heapq
 import networkx as nx
-from typing import Dict, List
+from typing import Dict, List, Optional
 from input.group import Group
 from input.robot import Robot
+from .group_betweenness import GroupBetweenness
 
 
 class FinderAdLeaders:
     def find_ad_leaders(self, group: Group, id_to_robots: Dict[int, Robot],
                        id_to_groups: Dict[int, Group], arc_graph: nx.Graph,
-                       shortest_path_dict: Dict, a: float, b: float, max_size: int) -> List[Robot]:
+                       shortest_path_dict: Dict, a: float, b: float, max_size: int,
+                       group_betweenness: Optional[GroupBetweenness] = None) -> List[Robot]:
         """Find backup leaders for a group."""
-        # Create subgraph for this group
-        sub_graph = nx.Graph()
         robot_id_set = group.robot_id_in_group
 
-        for robot_id in robot_id_set:
-            sub_graph.add_node(robot_id)
-            neighbors = list(arc_graph.neighbors(robot_id))
-
-            for neighbor_id in neighbors:
-                if neighbor_id == robot_id:
-                    continue
-
-                if id_to_robots[neighbor_id].group_id != group.group_id:
-                    continue
-
-                sub_graph.add_node(neighbor_id)
-                if not sub_graph.has_edge(robot_id, neighbor_id):
-                    weight = arc_graph[robot_id][neighbor_id]['weight']
-                    sub_graph.add_edge(robot_id, neighbor_id, weight=weight)
-
-        # Calculate betweenness centrality
-        betweenness_centrality = nx.betweenness_centrality(sub_graph, weight='weight')
+        # Betweenness centrality of the group's subgraph
+        if group_betweenness is None:
+            group_betweenness = GroupBetweenness(arc_graph)
+        betweenness_centrality = group_betweenness.calculate(group)
 
         # Select backup nodes - backup nodes enter priority queue sorted by ref value
         # I = b / (1 - (1 - FA)(1 - FO))
@@ -0,0 +1,26 @@
+import networkx as nx
+from typing import Dict
+from input.group import Group
+
+
+class GroupBetweenness:
+    def __init__(self, arc_graph: nx.Graph):
+        self.arc_graph = arc_graph
+        self.group_id_to_bc: Dict[int, Dict[int, float]] = {}
+
+    def calculate(self, group: Group) -> Dict[int, float]:
+        """Betweenness centrality of a group's subgraph, computed once per group and cached."""
+        # Only intra-group edges enter the subgraph, so edges added between leaders
+        # of different groups never invalidate a cached entry
+        if group.group_id not in self.group_id_to_bc:
+            sub_graph = self._build_sub_graph(group)
+            self.group_id_to_bc[group.group_id] = nx.betweenness_centrality(sub_graph, weight='weight')
+        return self.group_id_to_bc[group.group_id]
+
+    def _build_sub_graph(self, group: Group) -> nx.Graph:
+        """Create subgraph for this group."""
+        # Induced subgraph on the group's robots: only intra-layer edges are kept, so nodes
+        # from other layers (e.g., leader nodes connected to other leaders) never enter it
+        sub_graph = nx.Graph(self.arc_graph.subgraph(group.robot_id_in_group))
+        sub_graph.remove_edges_from(list(nx.selfloop_edges(sub_graph)))
+        return sub_graph
@@ -21,8 +21,7 @@ class IniContextLoadI:
         """Initialize contextual load for all robots."""
         function = Function(self.id_to_robots, self.id_to_groups)
 
-        for robot_id in self.id_to_robots.keys():
-            robot = self.id_to_robots[robot_id]
+        for robot_id, robot in self.id_to_robots.items():
             group = self.id_to_groups[robot.group_id]
             i_value = function.calculate_contextual_load(
                 group.leader, robot, self.arc_graph, self.shortest_path_dict, self.a, self.b
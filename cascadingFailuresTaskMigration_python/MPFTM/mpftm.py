@@ -10,6 +10,7 @@ from evaluation.evalution import Evalution
 from .finder_leader import FinderLeader
 from .finder_ad_leaders import FinderAdLeaders
 from .ad_leaders_replace import AdLeadersReplace
+from .group_betweenness import GroupBetweenness
 from .ini_context_load_i import IniContextLoadI
 from .calculate_pon_field import CalculatePonField
 from .task_migration_based_pon import TaskMigrationBasedPon
@@ -45,28 +46,34 @@ class MPFTM:
         sum_execute_cost = -10.0
         survival_rate = 0.10
 
-        # Calculate all shortest paths
+        # Calculate all shortest paths, flattened once to (from, to) keys for reuse
         self.shortest_path_dict = dict(nx.all_pairs_dijkstra_path_length(self.arc_graph, weight='weight'))
+        shortest_path_dict = self._convert_shortest_path_dict()
+
+        # Group subgraph betweenness centrality, shared by leader selection and replacement
+        group_betweenness = GroupBetweenness(self.arc_graph)
 
         # Leader selection
-        self._leader_selection(self.id_to_groups, self.id_to_robots, self.arc_graph)
+        self._leader_selection(self.id_to_groups, self.id_to_robots, self.arc_graph, group_betweenness)
 
         max_size = 2
-        self._ad_leaders_selection(self.id_to_groups, self.id_to_robots, self.arc_graph, max_size)
+        self._ad_leaders_selection(self.id_to_groups, self.id_to_robots, self.arc_graph,
+                                   shortest_path_dict, max_size, group_betweenness)
 
         # Replace failed leaders with backup leaders
-        ad_leaders_replace = AdLeadersReplace(self.id_to_groups, self.id_to_robots, self.arc_graph)
+        ad_leaders_replace = AdLeadersReplace(self.id_to_groups, self.id_to_robots, self.arc_graph,
+                                              group_betweenness)
         ad_leaders_replace.run()
 
         # Initialize contextual load
         ini_context = IniContextLoadI(self.id_to_groups, self.id_to_robots, self.arc_graph,
-                                     self._convert_shortest_path_dict(), self.id_to_i, self.a, self.b)
+                                     shortest_path_dict, self.id_to_i, self.a, self.b)
         ini_context.run()
 
         # Calculate potential field
         calculate_pon_field = CalculatePonField(self.id_to_groups, self.id_to_robots,
                                                self.arc_graph, self.id_to_i,
-                                               self._convert_shortest_path_dict(), self.a, self.b)
+                                               shortest_path_dict, self.a, self.b)
 
         # Calculate node potential field
         robot_id_to_pfield = calculate_pon_field.calculate_intra_p()
@@ -78,12 +85,12 @@ class MPFTM:
         task_migration = TaskMigrationBasedPon(
             self.id_to_groups, self.id_to_robots, self.arc_graph,
             group_id_to_pfield, robot_id_to_pfield,
-            self._convert_shortest_path_dict(), self.id_to_i, self.a, self.b
+            shortest_path_dict, self.id_to_i, self.a, self.b
         )
         migration_records = task_migration.run()
 
         sum_migration_cost += evalution.calculate_migration_cost(
-            self._convert_shortest_path_dict(), migration_records
+            shortest_path_dict, migration_records
         )
         sum_execute_cost += evalution.calculate_execute_tasks_cost(self.robots)
         survival_rate += evalution.calculate_mean_survival_rate(self.robots)
@@ -103,29 +110,30 @@ class MPFTM:
         return result
 
     def _ad_leaders_selection(self, id_to_groups: Dict[int, Group], id_to_robots: Dict[int, Robot],
-                              arc_graph: nx.Graph, max_size: int):
+                              arc_graph: nx.Graph, shortest_path_dict: Dict, max_size: int,
+                              group_betweenness: GroupBetweenness):
         """Select backup leaders for each group."""
         finder = FinderAdLeaders()
         for group in id_to_groups.values():
             if not group.ad_leaders:
                 group.ad_leaders = finder.find_ad_leaders(
                     group, id_to_robots, id_to_groups, arc_graph,
-                    self._convert_shortest_path_dict(), self.a, self.b, max_size
+                    shortest_path_dict, self.a, self.b, max_size, group_betweenness
                 )
 
     def _leader_selection(self, id_to_groups: Dict[int, Group], id_to_robots: Dict[int, Robot],
-                         arc_graph: nx.Graph):
+                         arc_graph: nx.Graph, group_betweenness: GroupBetweenness):
         """Select leader for each group."""
         finder = FinderLeader()
         for group in id_to_groups.values():
             if group.leader is None:
                 group.leader = finder.find_leader(group, id_to_robots, id_to_groups,
-                                                 arc_graph, self.a, self.b)
+                                                 arc_graph, self.a, self.b, group_betweenness)
 
         # Add edges between leader nodes
-        for group_id in id_to_groups.keys():
-            leader_id = id_to_groups[group_id].leader.robot_id
-            for to_group_id in id_to_groups.keys():
-                to_leader_id = id_to_groups[to_group_id].leader.robot_id
+        for group_id, group in id_to_groups.items():
+            leader_id = group.leader.robot_id
+            for to_group_id, to_group in id_to_groups.items():
+                to_leader_id = to_group.leader.robot_id
                 if group_id != to_group_id and not arc_graph.has_edge(leader_id, to_leader_id):
                     arc_graph.add_edge(leader_id, to_leader_id, weight=1)
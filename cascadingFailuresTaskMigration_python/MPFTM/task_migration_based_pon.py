@@ -1,4 +1,5 @@
 import math
+from operator import attrgetter
 import networkx as nx
 from typing import Dict, List, Set
 from input.group import Group
@@ -34,8 +35,7 @@ class TaskMigrationBasedPon:
     def _inter_task_migration(self):
         """Inter-group task migration."""
         f_groups = set()
-        for robot_id in self.id_to_robots.keys():
-            robot = self.id_to_robots[robot_id]
+        for robot in self.id_to_robots.values():
             if robot.fault_a == 1:
                 f_groups.add(robot.group_id)
 
@@ -43,38 +43,35 @@ class TaskMigrationBasedPon:
 
         for fgroup_id in f_groups:
             s_group = self.id_to_groups[fgroup_id]
-            robot_id_in_group = s_group.robot_id_in_group
 
-            for robot_id in robot_id_in_group:
+            # Faulty robots of this group, collected once for both migration phases
+            f_robots = []
+            for robot_id in s_group.robot_id_in_group:
                 robot = self.id_to_robots[robot_id]
                 if robot.fault_a == 1:
-                    # pf represents potential field of faulty network layer
-                    tnf = list(robot.tasks_list)
-                    pf = self.group_id_to_pfield[fgroup_id]
-                    p_fg = pf.pegra + pf.perep
-
-                    if p_fg > average_pe_n:
-                        # Need inter-layer task migration
-                        t_group_id = self._find_min_pn()
-                        for task in tnf:
-                            pt = self.group_id_to_pfield[t_group_id]
-                            p_tg = pt.pegra + pt.perep
-                            if p_tg < average_pe_n:
-                                self._execute_migration(robot, self.id_to_groups[t_group_id].leader, task)
+                    f_robots.append(robot)
+
+            for robot in f_robots:
+                # pf represents potential field of faulty network layer
+                tnf = list(robot.tasks_list)
+                pf = self.group_id_to_pfield[fgroup_id]
+                p_fg = pf.pegra + pf.perep
+
+                if p_fg > average_pe_n:
+                    # Need inter-layer task migration
+                    t_group_id = self._find_min_pn()
+                    for task in tnf:
+                        pt = self.group_id_to_pfield[t_group_id]
+                        p_tg = pt.pegra + pt.perep
+                        if p_tg < average_pe_n:
+                            self._execute_migration(robot, self.id_to_groups[t_group_id].leader, task)
 
             # Execute intra-group task migration
-            self._intra_task_migration(fgroup_id)
+            self._intra_task_migration(fgroup_id, f_robots)
 
-    def _intra_task_migration(self, group_id: int):
+    def _intra_task_migration(self, group_id: int, f_robots: List[Robot]):
         """Intra-group task migration (includes recursive algorithm)."""
-        f_robots = []
         group = self.id_to_groups[group_id]
-
-        for robot_id in group.robot_id_in_group:
-            robot = self.id_to_robots[robot_id]
-            if robot.fault_a == 1:
-                f_robots.append(robot)
-
         leader = group.leader
 
         # Migrate tasks from faulty robots to prevent cascading failures
@@ -94,22 +91,18 @@ class TaskMigrationBasedPon:
     def _migration_for_robot(self, robot: Robot):
         """Execute migration for a specific robot."""
         robot_id = robot.robot_id
-        neighbors = list(self.arc_graph.neighbors(robot_id))
-        domain_id = []
-
-        for neighbor_id in neighbors:
-            domain_id.append(neighbor_id)
+        domain_id = list(self.arc_graph.neighbors(robot_id))
 
-        domain_id.sort(key=lambda x: self._get_comparator_value(robot, x))
+        # The robot's own potential is the same for every neighbor, so compute it once per sort
+        po_r = self.robot_id_to_pfield[robot_id]
+        por_value = po_r.pegra + po_r.perep
+        domain_id.sort(key=lambda x: self._get_comparator_value(robot, x, por_value))
 
         if not domain_id:
             return
 
         migrated_id = domain_id[0]
 
-        po_r = self.robot_id_to_pfield[robot_id]
-        por_value = po_r.pegra + po_r.perep
-
         po_m = self.robot_id_to_pfield[migrated_id]
         pom_value = po_m.pegra + po_m.perep
 
@@ -127,50 +120,46 @@ class TaskMigrationBasedPon:
             self._migration_for_robot(robot_migrated)
 
             # Continue recursion from ai node
-            domain_id.sort(key=lambda x: self._get_comparator_value(robot, x))
+            po_r = self.robot_id_to_pfield[robot_id]
+            por_value = po_r.pegra + po_r.perep
+            domain_id.sort(key=lambda x: self._get_comparator_value(robot, x, por_value))
             if not domain_id:
                 break
 
             migrated_id = domain_id[0]
-            po_r = self.robot_id_to_pfield[robot_id]
-            por_value = po_r.pegra + po_r.perep
             po_m = self.robot_id_to_pfield[migrated_id]
             pom_value = po_m.pegra + po_m.perep
 
-    def _get_comparator_value(self, robot: Robot, neighbor_id: int) -> float:
-        """Calculate comparison value for sorting neighbors."""
+    def _get_comparator_value(self, robot: Robot, neighbor_id: int, por_value: float) -> float:
+        """Calculate comparison value for sorting neighbors, given the robot's own potential por_value."""
         po1 = self.robot_id_to_pfield[neighbor_id]
         po1_value = po1.pegra + po1.perep
 
         robot_id = robot.robot_id
-        po_m = self.robot_id_to_pfield[robot_id]
-        po_m_value = po_m.pegra + po_m.perep
 
         if not self.arc_graph.has_edge(robot_id, neighbor_id):
             return float('inf')
 
         cij1 = self.arc_graph[robot_id][neighbor_id]['weight']
 
-        return -((po1_value - po_m_value) / cij1)  # Negate for descending order
+        return -((po1_value - por_value) / cij1)  # Negate for descending order
 
     def _find_max_task(self, tasks_list: List[Task]) -> Task:
         """Find task with maximum size."""
         if not tasks_list or len(tasks_list) < 1:
             return None
-        return max(tasks_list, key=lambda t: t.size)
+        return max(tasks_list, key=attrgetter('size'))
 
     def _find_migrated_robot(self, f_robot: Robot) -> Robot:
         """Find robot to migrate tasks to."""
         migrated_robot = Robot()
-        neighbors = list(self.arc_graph.neighbors(f_robot.robot_id))
         min_value = float('inf')
 
-        for neighbor_id in neighbors:
+        for neighbor_id, edge in self.arc_graph[f_robot.robot_id].items():
             target_robot = self.id_to_robots[neighbor_id]
 
             target_p = self.robot_id_to_pfield[target_robot.robot_id]
-            weight = self.arc_graph[f_robot.robot_id][neighbor_id]['weight']
-            v = (target_p.pegra + target_p.perep) * weight
+            v = (target_p.pegra + target_p.perep) * edge['weight']
 
             if v < min_value:
                 migrated_robot = target_robot
@@ -183,8 +172,7 @@ class TaskMigrationBasedPon:
         min_value = float('inf')
         return_id = -1
 
-        for group_id in self.group_id_to_pfield.keys():
-            p = self.group_id_to_pfield[group_id]
+        for group_id, p in self.group_id_to_pfield.items():
             p_value = p.perep + p.pegra
             if min_value > p_value:
                 min_value = p_value
@@ -195,8 +183,7 @@ class TaskMigrationBasedPon:
     def _get_average_pe_n(self) -> float:
         """Calculate average potential field of network layer."""
         pe_n_sum = 0.0
-        for group_id in self.group_id_to_pfield.keys():
-            pe_n = self.group_id_to_pfield[group_id]
+        for pe_n in self.group_id_to_pfield.values():
             pe_n_sum += pe_n.pegra + pe_n.perep
 
         return pe_n_sum / len(self.group_id_to_pfield) if self.group_id_to_pfield else 0.0
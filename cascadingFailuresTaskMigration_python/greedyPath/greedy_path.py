@@ -40,18 +40,19 @@ class GreedyPath:
 
         survival_rate = -(random.random() * 0.1)
 
-        # Calculate all shortest paths
+        # Calculate all shortest paths, flattened once to (from, to) keys for reuse
         self.shortest_path_dict = dict(nx.all_pairs_dijkstra_path_length(self.arc_graph, weight='weight'))
+        shortest_path_dict = self._convert_shortest_path_dict()
 
         # Execute task migration
         greedy_migration = GreedyPathTasksMigration(
             self.id_to_groups, self.id_to_robots,
-            self._convert_shortest_path_dict(), self.arc_graph
+            shortest_path_dict, self.arc_graph
         )
         migration_records = greedy_migration.task_migration()
 
         sum_migration_cost = evalution.calculate_migration_cost(
-            self._convert_shortest_path_dict(), migration_records
+            shortest_path_dict, migration_records
         )
         sum_execute_cost = evalution.calculate_execute_tasks_cost(self.robots)
         survival_rate += evalution.calculate_mean_survival_rate(self.robots)
@@ -80,9 +81,9 @@ class GreedyPath:
                                                  arc_graph, self.a, self.b)
 
         # Add edges between leader nodes
-        for group_id in id_to_groups.keys():
-            leader_id = id_to_groups[group_id].leader.robot_id
-            for to_group_id in id_to_groups.keys():
-                to_leader_id = id_to_groups[to_group_id].leader.robot_id
+        for group_id, group in id_to_groups.items():
+            leader_id = group.leader.robot_id
+            for to_group_id, to_group in id_to_groups.items():
+                to_leader_id = to_group.leader.robot_id
                 if group_id != to_group_id and not arc_graph.has_edge(leader_id, to_leader_id):
                     arc_graph.add_edge(leader_id, to_leader_id, weight=10)
@@ -25,30 +25,33 @@ class Function:
 
     def _sig(self, x: float) -> float:
         """Sigmoid function variant."""
-        return (math.exp(math.log(x + 1)) - math.exp(-math.log(x + 1))) / \
-               (math.exp(math.log(x + 1)) + math.exp(-math.log(x + 1)))
+        # Evaluate each exponential term once and reuse it in numerator and denominator
+        log_term = math.log(x + 1)
+        exp_pos = math.exp(log_term)
+        exp_neg = math.exp(-log_term)
+        return (exp_pos - exp_neg) / (exp_pos + exp_neg)
 
     def calculate_contextual_load(self, leader, robot, arc_graph: nx.Graph,
                                   shortest_path_dict: Dict, a: float, b: float) -> float:
         """Calculate contextual load of a robot."""
         f = a * robot.load / robot.capacity - b * self.calculate_over_load_is(robot)
 
-        # Get domain F from connected edges
-        neighbors = list(arc_graph.neighbors(robot.robot_id))
+        # Get domain F from connected edges; the adjacency view yields each edge's data directly
+        adjacency = arc_graph[robot.robot_id]
         domain_f = 0.0
         cost_sum = 0.0
 
-        for neighbor_id in neighbors:
+        for neighbor_id, edge in adjacency.items():
             target_robot = self.id_to_robots[neighbor_id]
 
             if target_robot.group_id != robot.group_id or target_robot.robot_id == robot.robot_id:
                 continue
 
             # Sum of communication costs with connected edges
-            cost_sum += arc_graph[robot.robot_id][neighbor_id]['weight']
+            cost_sum += edge['weight']
             domain_f += a * target_robot.load / target_robot.capacity - b * self.calculate_over_load_is(target_robot)
 
-        size = len(neighbors) + 1
+        size = len(adjacency) + 1
         domain_num = size + 1
 
         # Add cost for inter-layer task migration
@@ -1,5 +1,7 @@
 import heapq
-from typing import List, Dict, Set
+from collections import deque
+from operator import attrgetter
+from typing import Deque, List, Dict, Set
 from input.task import Task
 from input.robot import Robot
 from input.group import Group
@@ -23,6 +25,7 @@ class Initialize:
         if fault_size == 0:
             fault_size += 1
         step = size // fault_size
+        function = Function(id_to_robots, id_to_groups)
 
         # 0.1 represents the proportion of nodes with functional faults in the system
         for i in range(size):
@@ -34,7 +37,6 @@ class Initialize:
                 group = id_to_groups[group_id]
                 group.group_capacity = group.group_capacity - robot.capacity
 
-            function = Function(id_to_robots, id_to_groups)
             fault_o = 1 - function.calculate_over_load_is(id_to_robots[i])
             robot.fault_o = fault_o
 
@@ -42,23 +44,21 @@ class Initialize:
                   id_to_groups: Dict[int, Group], id_to_robots: Dict[int, Robot]):
         """Initialize task assignment to robots and groups."""
         # Assign tasks with arrive_time == -1 to groups and robots (as initial state)
-        tasks_pre = []
-        for task in tasks[:]:
+        pre_size = 0
+        for task in tasks:
             if task.arrive_time != -1:
                 break
-            else:
-                tasks_pre.append(task)
-
-        for task in tasks_pre:
-            tasks.remove(task)
+            pre_size += 1
 
         # Sort tasks by size (descending) - assign largest tasks to robots with highest capacity
-        tasks_pre.sort(key=lambda t: t.size, reverse=True)
+        tasks_pre = deque(sorted(tasks[:pre_size], key=attrgetter('size'), reverse=True))
+        # The initial tasks form a prefix of the list, so drop them with one slice deletion
+        del tasks[:pre_size]
 
         # Initialize robot-task matching
         # Priority queue: robots sorted by load/capacity ratio
         pq_robots = []
-        robots.sort(key=lambda r: r.capacity, reverse=True)
+        robots.sort(key=attrgetter('capacity'), reverse=True)
 
         for robot in robots:
             # Update robots in group
@@ -85,15 +85,14 @@ class Initialize:
             heapq.heappush(pq_robots, (robot.load / robot.capacity, robot.robot_id, robot))
 
         # Fill in group capacity information
-        for group_id in id_to_groups.keys():
-            group = id_to_groups[group_id]
+        for group in id_to_groups.values():
             robot_id_in_group = group.robot_id_in_group
             capacity_sum = 0.0
             for robot_id in robot_id_in_group:
                 capacity_sum += id_to_robots[robot_id].capacity
             group.group_capacity = capacity_sum
 
-    def _update(self, tasks_pre: List[Task], robot: Robot, id_to_groups: Dict[int, Group]):
+    def _update(self, tasks_pre: Deque[Task], robot: Robot, id_to_groups: Dict[int, Group]):
         """Update robot and group with assigned task."""
         robot_tasks_list = robot.tasks_list
         if not tasks_pre:
@@ -109,5 +108,5 @@ class Initialize:
         group.group_load = group.group_load + tasks_pre[0].size
         group.group_id = group_id
 
-        tasks_pre.pop(0)
+        tasks_pre.popleft()
         robot.tasks_list = robot_tasks_list
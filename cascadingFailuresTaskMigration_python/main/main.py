@@ -1,27 +1,57 @@
+import io
+import os
+import sys
 import time
+from typing import Optional, TextIO
 from input.reader import Reader
 from LTM.ltm import LTM
 from MPFTM.mpftm import MPFTM
 from evaluation.evaluation_etra_target import EvaluationEtraTarget
 
+EXPERIMENT_RESULT_TEMPLATE = (
+    "meanExecuteCost: {mean_execute_cost}\n"
+    "meanMigrationCost: {mean_migration_cost}\n"
+    "meanSurvivalRate: {mean_survival_rate}\n"
+    "robotLoadStd: {robot_load_std}\n"
+    "taskSizeStd: {task_size_std}\n"
+    "meanRobotCapacity: {mean_robot_capacity}\n"
+    "meanTaskSize: {mean_task_size}\n"
+    "targetOpt: {target_opt}\n"
+)
+
+# Data files live in the project root, one level above this package
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RUN_SEPARATOR = (
+    "*******************************\n"
+    "                               \n"
+)
+
 
 def print_experiment_result(a: float, b: float, robot_load_std: float, task_size_std: float,
-                           mean_robot_capacity: float, mean_task_size: float, experiment_result):
-    """Print experiment results."""
+                           mean_robot_capacity: float, mean_task_size: float, experiment_result,
+                           out: Optional[TextIO] = None):
+    """Print experiment results to out (stdout by default)."""
+    if out is None:
+        out = sys.stdout
+
     mean_execute_cost = experiment_result.mean_execute_cost
     mean_migration_cost = experiment_result.mean_migration_cost
     mean_survival_rate = experiment_result.mean_survival_rate
 
     target_opt = calculate_target_opt(a, b, mean_execute_cost + mean_migration_cost, mean_survival_rate)
 
-    print(f"meanExecuteCost: {mean_execute_cost}")
-    print(f"meanMigrationCost: {mean_migration_cost}")
-    print(f"meanSurvivalRate: {mean_survival_rate}")
-    print(f"robotLoadStd: {robot_load_std}")
-    print(f"taskSizeStd: {task_size_std}")
-    print(f"meanRobotCapacity: {mean_robot_capacity}")
-    print(f"meanTaskSize: {mean_task_size}")
-    print(f"targetOpt: {target_opt}")
+    # Fill the whole report from one template and emit it with a single write
+    out.write(EXPERIMENT_RESULT_TEMPLATE.format(
+        mean_execute_cost=mean_execute_cost,
+        mean_migration_cost=mean_migration_cost,
+        mean_survival_rate=mean_survival_rate,
+        robot_load_std=robot_load_std,
+        task_size_std=task_size_std,
+        mean_robot_capacity=mean_robot_capacity,
+        mean_task_size=mean_task_size,
+        target_opt=target_opt,
+    ))
 
 
 def calculate_target_opt(a: float, b: float, mean_cost: float, mean_survival_rate: float) -> float:
@@ -30,9 +60,9 @@ def calculate_target_opt(a: float, b: float, mean_cost: float, mean_survival_rat
 
 
 def main():
-    tasks_file = "Task24.txt"
-    robot_file = "RobotsInformation4.txt"
-    graph_file = "Graph4.txt"
+    tasks_file = os.path.join(PROJECT_ROOT, "Task24.txt")
+    robot_file = os.path.join(PROJECT_ROOT, "RobotsInformation4.txt")
+    graph_file = os.path.join(PROJECT_ROOT, "Graph4.txt")
 
     reader = Reader()
 
@@ -52,30 +82,24 @@ def main():
     mean_robot_capacity = evaluation_etra_target.calculate_mean_robot_capacity(robots)
     mean_task_size = evaluation_etra_target.calculate_mean_task_size(tasks)
 
-    start_time = time.time()
+    # Algorithms to compare: (class, run method); they share the parsed inputs
+    algorithms = [(LTM, "greedy_run"), (MPFTM, "mpfm_run")]
 
-    mpftm = MPFTM(tasks, arc_graph, robots, a, b)
-    ltm = LTM(tasks, arc_graph, robots, a, b)
-    experiment_result = ltm.greedy_run()
+    for index, (algorithm_class, run_method) in enumerate(algorithms):
+        if index > 0:
+            sys.stdout.write(RUN_SEPARATOR)
 
-    end_time = time.time()
-
-    print(f"程序运行时间: {int((end_time - start_time) * 1000)}ms")
-    print_experiment_result(a, b, robot_capacity_std, task_size_std,
-                           mean_robot_capacity, mean_task_size, experiment_result)
-
-    print("*******************************")
-    print("                               ")
-
-    # Re-read tasks for second run
-    tasks = reader.read_file_to_tasks(tasks_file)
-    start_time = time.time()
-    experiment_result_mpftm = mpftm.mpfm_run()
-    end_time = time.time()
+        algorithm = algorithm_class(tasks, arc_graph, robots, a, b)
+        start_time = time.perf_counter_ns()
+        experiment_result = getattr(algorithm, run_method)()
+        end_time = time.perf_counter_ns()
 
-    print(f"程序运行时间: {int((end_time - start_time) * 1000)}ms")
-    print_experiment_result(a, b, robot_capacity_std, task_size_std,
-                           mean_robot_capacity, mean_task_size, experiment_result_mpftm)
+        # Assemble the runtime line and the result report, then emit them together
+        report = io.StringIO()
+        report.write(f"程序运行时间: {(end_time - start_time) // 1_000_000}ms\n")
+        print_experiment_result(a, b, robot_capacity_std, task_size_std,
+                               mean_robot_capacity, mean_task_size, experiment_result, out=report)
+        sys.stdout.write(report.getvalue())
 
 
 if __name__ == "__main__":
@@ -24,8 +24,7 @@ class OptMigration:
     def run(self) -> List[MigrationRecord]:
         """Run optimization algorithm to find best task allocation."""
         # Collect all tasks
-        for robot_id in self.id_to_robots.keys():
-            robot = self.id_to_robots[robot_id]
+        for robot in self.id_to_robots.values():
             self.all_tasks.extend(robot.tasks_list)
 
         # Create temporary copies
@@ -33,8 +32,7 @@ class OptMigration:
         id_to_groups_temp = self._group_map_copy_org(self.id_to_groups)
 
         # Record original task-robot mapping
-        for robot_id in self.id_to_robots.keys():
-            robot = self.id_to_robots[robot_id]
+        for robot in self.id_to_robots.values():
             for task in robot.tasks_list:
                 self.task_to_robot[task] = robot
 
@@ -59,8 +57,7 @@ class OptMigration:
                 print(f"{index} {self.min_target_value}")
             return
 
-        for robot_id in id_to_robots_temp.keys():
-            robot_temp = id_to_robots_temp[robot_id]
+        for robot_temp in id_to_robots_temp.values():
             if robot_temp.fault_a == 1:
                 continue  # Faulty robots cannot receive tasks
 